@@ -32,6 +32,8 @@ class StreamReadPages:
 
 @dataclass
 class StreamReadSlicesInnerPagesInner:
+    __slots__ = ("records", "request", "response")
+
     records: List[object]
     request: Optional[HttpRequest]
     response: Optional[HttpResponse]
@@ -45,6 +47,8 @@ class StreamReadSlicesInnerSliceDescriptor:
 
 @dataclass
 class StreamReadSlicesInner:
+    __slots__ = ("pages", "slice_descriptor", "state")
+
     pages: List[StreamReadSlicesInnerPagesInner]
     slice_descriptor: Optional[StreamReadSlicesInnerSliceDescriptor]
     state: Optional[Dict[str, Any]]
@@ -52,12 +56,16 @@ class StreamReadSlicesInner:
 
 @dataclass
 class LogMessage:
+    __slots__ = ("message", "level")
+
     message: str
     level: str
 
 
 @dataclass
 class StreamRead(object):
+    __slots__ = ("logs", "slices", "test_read_limit_reached", "inferred_schema")
+
     logs: List[LogMessage]
     slices: List[StreamReadSlicesInner]
     test_read_limit_reached: bool
@@ -40,6 +40,7 @@ class DeclarativeStream(Stream):
     _name: str = field(init=False, repr=False, default="")
     _primary_key: str = field(init=False, repr=False, default="")
     _schema_loader: SchemaLoader = field(init=False, repr=False, default=None)
+    _json_schema: Optional[Mapping[str, Any]] = field(init=False, repr=False, compare=False, default=None)
     stream_cursor_field: Optional[Union[InterpolatedString, str]] = None
     transformations: List[RecordTransformation] = None
 
@@ -133,7 +134,10 @@ class DeclarativeStream(Stream):
         The default implementation of this method looks for a JSONSchema file with the same name as this stream's "name" property.
         Override as needed.
         """
-        return self._schema_loader.get_json_schema()
+        # The schema is requested for every record that is emitted, so it is only loaded once per stream
+        if self._json_schema is None:
+            self._json_schema = self._schema_loader.get_json_schema()
+        return self._json_schema
 
     def stream_slices(
         self, *, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
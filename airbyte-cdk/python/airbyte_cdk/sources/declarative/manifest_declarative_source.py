@@ -6,6 +6,7 @@ import json
 import logging
 import pkgutil
 import re
+from functools import lru_cache
 from importlib import metadata
 from typing import Any, Iterator, List, Mapping, MutableMapping, Union
 
@@ -27,8 +28,21 @@ from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import
 from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import ModelToComponentFactory
 from airbyte_cdk.sources.declarative.types import ConnectionDefinition
 from airbyte_cdk.sources.streams.core import Stream
-from jsonschema.exceptions import ValidationError
-from jsonschema.validators import validate
+from jsonschema.exceptions import ValidationError, best_match
+from jsonschema.validators import validator_for
+
+
+@lru_cache(maxsize=None)
+def _get_declarative_component_schema_validator():
+    """
+    Loads the declarative component schema and builds a validator for it. The schema ships with the CDK and never changes at runtime,
+    so it is only read, parsed and checked once rather than every time a source is created
+    """
+    raw_component_schema = pkgutil.get_data("airbyte_cdk", "sources/declarative/declarative_component_schema.yaml")
+    declarative_component_schema = yaml.load(raw_component_schema, Loader=yaml.SafeLoader)
+    validator_class = validator_for(declarative_component_schema)
+    validator_class.check_schema(declarative_component_schema)
+    return validator_class(declarative_component_schema)
 
 
 class ManifestDeclarativeSource(DeclarativeSource):
@@ -144,8 +158,7 @@ class ManifestDeclarativeSource(DeclarativeSource):
         Validates the connector manifest against the declarative component schema
         """
         try:
-            raw_component_schema = pkgutil.get_data("airbyte_cdk", "sources/declarative/declarative_component_schema.yaml")
-            declarative_component_schema = yaml.load(raw_component_schema, Loader=yaml.SafeLoader)
+            declarative_component_schema_validator = _get_declarative_component_schema_validator()
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Failed to read manifest component json schema required for validation: {e}")
 
@@ -153,10 +166,9 @@ class ManifestDeclarativeSource(DeclarativeSource):
         if not streams:
             raise ValidationError(f"A valid manifest should have at least one stream defined. Got {streams}")
 
-        try:
-            validate(self._source_config, declarative_component_schema)
-        except ValidationError as e:
-            raise ValidationError("Validation against json schema defined in declarative_component_schema.yaml schema failed") from e
+        error = best_match(declarative_component_schema_validator.iter_errors(self._source_config))
+        if error is not None:
+            raise ValidationError("Validation against json schema defined in declarative_component_schema.yaml schema failed") from error
 
         cdk_version = metadata.version("airbyte_cdk")
         cdk_major, cdk_minor, cdk_patch = self._get_version_parts(cdk_version, "airbyte-cdk")
@@ -2,8 +2,6 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-import copy
-import dataclasses
 import json
 import logging
 from unittest import mock
@@ -23,9 +21,8 @@ from airbyte_cdk.connector_builder.connector_builder_handler import (
     resolve_manifest,
 )
 from airbyte_cdk.connector_builder.main import handle_connector_builder_request, handle_request, read_stream
-from airbyte_cdk.connector_builder.models import LogMessage, StreamRead, StreamReadSlicesInner, StreamReadSlicesInnerPagesInner
+from airbyte_cdk.connector_builder.models import StreamRead, StreamReadSlicesInner, StreamReadSlicesInnerPagesInner
 from airbyte_cdk.models import (
-    AirbyteLogMessage,
     AirbyteMessage,
     AirbyteRecordMessage,
     AirbyteStream,
@@ -33,11 +30,9 @@ from airbyte_cdk.models import (
     ConfiguredAirbyteStream,
     ConnectorSpecification,
     DestinationSyncMode,
-    Level,
     SyncMode,
+    Type,
 )
-from airbyte_cdk.models import Type
-from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
 from airbyte_cdk.sources.declarative.retrievers import SimpleRetrieverTestReadDecorator
@@ -96,6 +91,135 @@ MANIFEST = {
     }
 }
 
+EXPECTED_RESOLVED_MANIFEST = {
+    "type": "DeclarativeSource",
+    "version": "0.30.3",
+    "definitions": {
+        "retriever": {
+            "paginator": {
+                "type": "DefaultPaginator",
+                "page_size": _page_size,
+                "page_size_option": {"inject_into": "request_parameter", "field_name": "page_size"},
+                "page_token_option": {"inject_into": "path", "type": "RequestPath"},
+                "pagination_strategy": {"type": "CursorPagination", "cursor_value": "{{ response._metadata.next }}", "page_size": _page_size},
+            },
+            "partition_router": {
+                "type": "ListPartitionRouter",
+                "values": ["0", "1", "2", "3", "4", "5", "6", "7"],
+                "cursor_field": "item_id",
+            },
+            "requester": {
+                "path": "/v3/marketing/lists",
+                "authenticator": {"type": "BearerAuthenticator", "api_token": "{{ config.apikey }}"},
+                "request_parameters": {"a_param": "10"},
+            },
+            "record_selector": {"extractor": {"field_path": ["result"]}},
+        },
+    },
+    "streams": [
+        {
+            "type": "DeclarativeStream",
+            "retriever": {
+                "type": "SimpleRetriever",
+                "paginator": {
+                    "type": "DefaultPaginator",
+                    "page_size": _page_size,
+                    "page_size_option": {
+                        "type": "RequestOption",
+                        "inject_into": "request_parameter",
+                        "field_name": "page_size",
+                        "name": _stream_name,
+                        "primary_key": _stream_primary_key,
+                        "url_base": _stream_url_base,
+                        "$parameters": _stream_options,
+                    },
+                    "page_token_option": {
+                        "type": "RequestPath",
+                        "inject_into": "path",
+                        "name": _stream_name,
+                        "primary_key": _stream_primary_key,
+                        "url_base": _stream_url_base,
+                        "$parameters": _stream_options,
+                    },
+                    "pagination_strategy": {
+                        "type": "CursorPagination",
+                        "cursor_value": "{{ response._metadata.next }}",
+                        "name": _stream_name,
+                        "primary_key": _stream_primary_key,
+                        "url_base": _stream_url_base,
+                        "$parameters": _stream_options,
+                        "page_size": _page_size,
+                    },
+                    "name": _stream_name,
+                    "primary_key": _stream_primary_key,
+                    "url_base": _stream_url_base,
+                    "$parameters": _stream_options,
+                },
+                "requester": {
+                    "type": "HttpRequester",
+                    "path": "/v3/marketing/lists",
+                    "authenticator": {
+                        "type": "BearerAuthenticator",
+                        "api_token": "{{ config.apikey }}",
+                        "name": _stream_name,
+                        "primary_key": _stream_primary_key,
+                        "url_base": _stream_url_base,
+                        "$parameters": _stream_options,
+                    },
+                    "request_parameters": {"a_param": "10"},
+                    "name": _stream_name,
+                    "primary_key": _stream_primary_key,
+                    "url_base": _stream_url_base,
+                    "$parameters": _stream_options,
+                },
+                "partition_router": {
+                    "type": "ListPartitionRouter",
+                    "values": ["0", "1", "2", "3", "4", "5", "6", "7"],
+                    "cursor_field": "item_id",
+                    "name": _stream_name,
+                    "primary_key": _stream_primary_key,
+                    "url_base": _stream_url_base,
+                    "$parameters": _stream_options,
+                },
+                "record_selector": {
+                    "type": "RecordSelector",
+                    "extractor": {
+                        "type": "DpathExtractor",
+                        "field_path": ["result"],
+                        "name": _stream_name,
+                        "primary_key": _stream_primary_key,
+                        "url_base": _stream_url_base,
+                        "$parameters": _stream_options,
+                    },
+                    "name": _stream_name,
+                    "primary_key": _stream_primary_key,
+                    "url_base": _stream_url_base,
+                    "$parameters": _stream_options,
+                },
+                "name": _stream_name,
+                "primary_key": _stream_primary_key,
+                "url_base": _stream_url_base,
+                "$parameters": _stream_options,
+            },
+            "name": _stream_name,
+            "primary_key": _stream_primary_key,
+            "url_base": _stream_url_base,
+            "$parameters": _stream_options,
+        },
+    ],
+    "check": {"type": "CheckStream", "stream_names": ["lists"]},
+    "spec": {
+        "connection_specification": {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "required": [],
+            "properties": {},
+            "additionalProperties": True
+        },
+        "type": "Spec"
+    }
+}
+
 RESOLVE_MANIFEST_CONFIG = {
     "__injected_declarative_manifest": MANIFEST,
     "__command": "resolve_manifest",
@@ -137,41 +261,53 @@ CONFIGURED_CATALOG = {
     ]
 }
 
+_CONFIGURED_CATALOG_PARSED = ConfiguredAirbyteCatalog.parse_obj(CONFIGURED_CATALOG)
 
-@pytest.fixture
-def valid_resolve_manifest_config_file(tmp_path):
-    config_file = tmp_path / "config.json"
-    config_file.write_text(json.dumps(RESOLVE_MANIFEST_CONFIG))
+# Serialized once at import time so fixtures only have to write the bytes to disk
+_RESOLVE_MANIFEST_CONFIG_BYTES = json.dumps(RESOLVE_MANIFEST_CONFIG).encode()
+_TEST_READ_CONFIG_BYTES = json.dumps(TEST_READ_CONFIG).encode()
+_DUMMY_CATALOG_BYTES = json.dumps(DUMMY_CATALOG).encode()
+_CONFIGURED_CATALOG_BYTES = json.dumps(CONFIGURED_CATALOG).encode()
+_INVALID_CONFIG_BYTES = json.dumps({**RESOLVE_MANIFEST_CONFIG, "__command": "bad_command"}).encode()
+
+
+@pytest.fixture(scope="session")
+def manifest_source():
+    return ManifestDeclarativeSource(MANIFEST)
+
+
+@pytest.fixture(scope="module")
+def valid_resolve_manifest_config_file(tmp_path_factory):
+    config_file = tmp_path_factory.mktemp("valid_resolve_manifest_config_file") / "config.json"
+    config_file.write_bytes(_RESOLVE_MANIFEST_CONFIG_BYTES)
     return config_file
 
 
-@pytest.fixture
-def valid_read_config_file(tmp_path):
-    config_file = tmp_path / "config.json"
-    config_file.write_text(json.dumps(TEST_READ_CONFIG))
+@pytest.fixture(scope="module")
+def valid_read_config_file(tmp_path_factory):
+    config_file = tmp_path_factory.mktemp("valid_read_config_file") / "config.json"
+    config_file.write_bytes(_TEST_READ_CONFIG_BYTES)
     return config_file
 
 
-@pytest.fixture
-def dummy_catalog(tmp_path):
-    config_file = tmp_path / "catalog.json"
-    config_file.write_text(json.dumps(DUMMY_CATALOG))
+@pytest.fixture(scope="module")
+def dummy_catalog(tmp_path_factory):
+    config_file = tmp_path_factory.mktemp("dummy_catalog") / "catalog.json"
+    config_file.write_bytes(_DUMMY_CATALOG_BYTES)
     return config_file
 
 
-@pytest.fixture
-def configured_catalog(tmp_path):
-    config_file = tmp_path / "catalog.json"
-    config_file.write_text(json.dumps(CONFIGURED_CATALOG))
+@pytest.fixture(scope="module")
+def configured_catalog(tmp_path_factory):
+    config_file = tmp_path_factory.mktemp("configured_catalog") / "catalog.json"
+    config_file.write_bytes(_CONFIGURED_CATALOG_BYTES)
     return config_file
 
 
-@pytest.fixture
-def invalid_config_file(tmp_path):
-    invalid_config = copy.deepcopy(RESOLVE_MANIFEST_CONFIG)
-    invalid_config["__command"] = "bad_command"
-    config_file = tmp_path / "config.json"
-    config_file.write_text(json.dumps(invalid_config))
+@pytest.fixture(scope="module")
+def invalid_config_file(tmp_path_factory):
+    config_file = tmp_path_factory.mktemp("invalid_config_file") / "config.json"
+    config_file.write_bytes(_INVALID_CONFIG_BYTES)
     return config_file
 
 
@@ -187,144 +323,15 @@ def test_handle_test_read(valid_read_config_file, configured_catalog):
         assert patch.call_count == 1
 
 
-def test_resolve_manifest(valid_resolve_manifest_config_file):
-    config = copy.deepcopy(RESOLVE_MANIFEST_CONFIG)
+def test_resolve_manifest(valid_resolve_manifest_config_file, manifest_source):
     command = "resolve_manifest"
-    config["__command"] = command
-    source = ManifestDeclarativeSource(MANIFEST)
+    config = {**RESOLVE_MANIFEST_CONFIG, "__command": command}
     limits = TestReadLimits()
-    resolved_manifest = handle_connector_builder_request(source, command, config, create_configured_catalog("dummy_stream"), limits)
+    resolved_manifest = handle_connector_builder_request(manifest_source, command, config, create_configured_catalog("dummy_stream"), limits)
 
-    expected_resolved_manifest = {
-        "type": "DeclarativeSource",
-        "version": "0.30.3",
-        "definitions": {
-            "retriever": {
-                "paginator": {
-                    "type": "DefaultPaginator",
-                    "page_size": _page_size,
-                    "page_size_option": {"inject_into": "request_parameter", "field_name": "page_size"},
-                    "page_token_option": {"inject_into": "path", "type": "RequestPath"},
-                    "pagination_strategy": {"type": "CursorPagination", "cursor_value": "{{ response._metadata.next }}", "page_size": _page_size},
-                },
-                "partition_router": {
-                    "type": "ListPartitionRouter",
-                    "values": ["0", "1", "2", "3", "4", "5", "6", "7"],
-                    "cursor_field": "item_id",
-                },
-                "requester": {
-                    "path": "/v3/marketing/lists",
-                    "authenticator": {"type": "BearerAuthenticator", "api_token": "{{ config.apikey }}"},
-                    "request_parameters": {"a_param": "10"},
-                },
-                "record_selector": {"extractor": {"field_path": ["result"]}},
-            },
-        },
-        "streams": [
-            {
-                "type": "DeclarativeStream",
-                "retriever": {
-                    "type": "SimpleRetriever",
-                    "paginator": {
-                        "type": "DefaultPaginator",
-                        "page_size": _page_size,
-                        "page_size_option": {
-                            "type": "RequestOption",
-                            "inject_into": "request_parameter",
-                            "field_name": "page_size",
-                            "name": _stream_name,
-                            "primary_key": _stream_primary_key,
-                            "url_base": _stream_url_base,
-                            "$parameters": _stream_options,
-                        },
-                        "page_token_option": {
-                            "type": "RequestPath",
-                            "inject_into": "path",
-                            "name": _stream_name,
-                            "primary_key": _stream_primary_key,
-                            "url_base": _stream_url_base,
-                            "$parameters": _stream_options,
-                        },
-                        "pagination_strategy": {
-                            "type": "CursorPagination",
-                            "cursor_value": "{{ response._metadata.next }}",
-                            "name": _stream_name,
-                            "primary_key": _stream_primary_key,
-                            "url_base": _stream_url_base,
-                            "$parameters": _stream_options,
-                            "page_size": _page_size,
-                        },
-                        "name": _stream_name,
-                        "primary_key": _stream_primary_key,
-                        "url_base": _stream_url_base,
-                        "$parameters": _stream_options,
-                    },
-                    "requester": {
-                        "type": "HttpRequester",
-                        "path": "/v3/marketing/lists",
-                        "authenticator": {
-                            "type": "BearerAuthenticator",
-                            "api_token": "{{ config.apikey }}",
-                            "name": _stream_name,
-                            "primary_key": _stream_primary_key,
-                            "url_base": _stream_url_base,
-                            "$parameters": _stream_options,
-                        },
-                        "request_parameters": {"a_param": "10"},
-                        "name": _stream_name,
-                        "primary_key": _stream_primary_key,
-                        "url_base": _stream_url_base,
-                        "$parameters": _stream_options,
-                    },
-                    "partition_router": {
-                        "type": "ListPartitionRouter",
-                        "values": ["0", "1", "2", "3", "4", "5", "6", "7"],
-                        "cursor_field": "item_id",
-                        "name": _stream_name,
-                        "primary_key": _stream_primary_key,
-                        "url_base": _stream_url_base,
-                        "$parameters": _stream_options,
-                    },
-                    "record_selector": {
-                        "type": "RecordSelector",
-                        "extractor": {
-                            "type": "DpathExtractor",
-                            "field_path": ["result"],
-                            "name": _stream_name,
-                            "primary_key": _stream_primary_key,
-                            "url_base": _stream_url_base,
-                            "$parameters": _stream_options,
-                        },
-                        "name": _stream_name,
-                        "primary_key": _stream_primary_key,
-                        "url_base": _stream_url_base,
-                        "$parameters": _stream_options,
-                    },
-                    "name": _stream_name,
-                    "primary_key": _stream_primary_key,
-                    "url_base": _stream_url_base,
-                    "$parameters": _stream_options,
-                },
-                "name": _stream_name,
-                "primary_key": _stream_primary_key,
-                "url_base": _stream_url_base,
-                "$parameters": _stream_options,
-            },
-        ],
-        "check": {"type": "CheckStream", "stream_names": ["lists"]},
-        "spec": {
-            "connection_specification": {
-                "$schema": "http://json-schema.org/draft-07/schema#",
-                "type": "object",
-                "required": [],
-                "properties": {},
-                "additionalProperties": True
-            },
-            "type": "Spec"
-        }
-    }
-    assert resolved_manifest.record.data["manifest"] == expected_resolved_manifest
+    assert resolved_manifest.record.data["manifest"] == EXPECTED_RESOLVED_MANIFEST
     assert resolved_manifest.record.stream == "resolve_manifest"
+    assert manifest_source.resolved_manifest is manifest_source.resolved_manifest
 
 
 def test_resolve_manifest_error_returns_error_response():
@@ -338,9 +345,8 @@ def test_resolve_manifest_error_returns_error_response():
     assert "Error resolving manifest" in response.trace.error.message
 
 
-def test_read():
+def test_read(manifest_source):
     config = TEST_READ_CONFIG
-    source = ManifestDeclarativeSource(MANIFEST)
 
     real_record = AirbyteRecordMessage(data={"id": "1234", "key": "value"}, emitted_at=1, stream=_stream_name)
     stream_read = StreamRead(
@@ -355,9 +361,10 @@ def test_read():
         test_read_limit_reached=False,
         inferred_schema=None,
     )
+    assert not hasattr(stream_read, "__dict__")
 
     expected_airbyte_message = AirbyteMessage(
-        type=MessageType.RECORD,
+        type=Type.RECORD,
         record=AirbyteRecordMessage(
             stream=_stream_name,
             data={
@@ -374,7 +381,7 @@ def test_read():
     limits = TestReadLimits()
     with patch("airbyte_cdk.connector_builder.message_grouper.MessageGrouper.get_message_groups", return_value=stream_read):
         output_record = handle_connector_builder_request(
-            source, "test_read", config, ConfiguredAirbyteCatalog.parse_obj(CONFIGURED_CATALOG), limits
+            manifest_source, "test_read", config, _CONFIGURED_CATALOG_PARSED, limits
         )
         output_record.record.emitted_at = 1
         assert output_record == expected_airbyte_message
@@ -400,18 +407,20 @@ def test_read_returns_error_response(mock_from_exception):
 
     source = MockManifestDeclarativeSource()
     limits = TestReadLimits()
-    response = read_stream(source, TEST_READ_CONFIG, ConfiguredAirbyteCatalog.parse_obj(CONFIGURED_CATALOG), limits)
-
-    expected_stream_read = StreamRead(logs=[LogMessage("error_message - a stack trace", "ERROR")],
-                                      slices=[StreamReadSlicesInner(
-                                          pages=[StreamReadSlicesInnerPagesInner(records=[], request=None, response=None)],
-                                          slice_descriptor=None, state=None)],
-                                      test_read_limit_reached=False,
-                                      inferred_schema=None)
+    response = read_stream(source, TEST_READ_CONFIG, _CONFIGURED_CATALOG_PARSED, limits)
 
     expected_message = AirbyteMessage(
-        type=MessageType.RECORD,
-        record=AirbyteRecordMessage(stream=_stream_name, data=dataclasses.asdict(expected_stream_read), emitted_at=1),
+        type=Type.RECORD,
+        record=AirbyteRecordMessage(
+            stream=_stream_name,
+            data={
+                "logs": [{"message": "error_message - a stack trace", "level": "ERROR"}],
+                "slices": [{"pages": [{"records": [], "request": None, "response": None}], "slice_descriptor": None, "state": None}],
+                "test_read_limit_reached": False,
+                "inferred_schema": None,
+            },
+            emitted_at=1,
+        ),
     )
     response.record.emitted_at = 1
     assert response == expected_message
@@ -428,35 +437,47 @@ def test_read_returns_error_response(mock_from_exception):
     ],
 )
 def test_invalid_protocol_command(command, valid_resolve_manifest_config_file):
-    config = copy.deepcopy(RESOLVE_MANIFEST_CONFIG)
-    config["__command"] = "list_streams"
     with pytest.raises(SystemExit):
         handle_request([command, "--config", str(valid_resolve_manifest_config_file), "--catalog", ""])
 
 
-def test_missing_command(valid_resolve_manifest_config_file):
+@pytest.mark.parametrize(
+    "args",
+    [
+        pytest.param(["--config", "{config_file}", "--catalog", ""], id="test_missing_command"),
+        pytest.param(["read", "--config", "{config_file}"], id="test_missing_catalog"),
+        pytest.param(["read", "--catalog", "{config_file}"], id="test_missing_config"),
+    ],
+)
+def test_missing_arguments(args, valid_resolve_manifest_config_file):
+    args = [arg.format(config_file=str(valid_resolve_manifest_config_file)) for arg in args]
     with pytest.raises(SystemExit):
-        handle_request(["--config", str(valid_resolve_manifest_config_file), "--catalog", ""])
+        handle_request(args)
 
 
-def test_missing_catalog(valid_resolve_manifest_config_file):
-    with pytest.raises(SystemExit):
-        handle_request(["read", "--config", str(valid_resolve_manifest_config_file)])
+def test_invalid_config_command(invalid_config_file, dummy_catalog):
+    with pytest.raises(ValueError):
+        handle_request(["read", "--config", str(invalid_config_file), "--catalog", str(dummy_catalog)])
 
 
-def test_missing_config(valid_resolve_manifest_config_file):
-    with pytest.raises(SystemExit):
-        handle_request(["read", "--catalog", str(valid_resolve_manifest_config_file)])
+def create_mock_http_stream(name, url_base, path):
+    http_stream = mock.Mock(spec=HttpStream)
+    http_stream.name = name
+    http_stream.url_base = url_base
+    http_stream.path.return_value = path
+    return http_stream
 
 
-def test_invalid_config_command(invalid_config_file, dummy_catalog):
-    with pytest.raises(ValueError):
-        handle_request(["read", "--config", str(invalid_config_file), "--catalog", str(dummy_catalog)])
+def create_mock_declarative_stream(http_stream):
+    declarative_stream = mock.Mock(spec=DeclarativeStream)
+    declarative_stream.retriever = http_stream
+    return declarative_stream
 
 
 @pytest.fixture
 def manifest_declarative_source():
-    return mock.Mock(spec=ManifestDeclarativeSource, autospec=True)
+    # list_streams only calls `streams`, so there is no need to spec the whole ManifestDeclarativeSource
+    return mock.Mock(spec=["streams"])
 
 
 def test_list_streams(manifest_declarative_source):
@@ -467,7 +488,7 @@ def test_list_streams(manifest_declarative_source):
 
     result = list_streams(manifest_declarative_source, {})
 
-    assert result.type == MessageType.RECORD
+    assert result.type == Type.RECORD
     assert result.record.stream == "list_streams"
     assert result.record.data == {
         "streams": [
@@ -477,67 +498,59 @@ def test_list_streams(manifest_declarative_source):
     }
 
 
-def test_given_stream_is_not_declarative_stream_when_list_streams_then_return_exception_message(manifest_declarative_source):
-    manifest_declarative_source.streams.return_value = [mock.Mock(spec=Stream)]
-
-    error_message = list_streams(manifest_declarative_source, {})
-
-    assert error_message.type == MessageType.TRACE
-    assert "Error listing streams." == error_message.trace.error.message
-    assert "A declarative source should only contain streams of type DeclarativeStream" in error_message.trace.error.internal_message
-
-
-def test_given_declarative_stream_retriever_is_not_http_when_list_streams_then_return_exception_message(manifest_declarative_source):
-    declarative_stream = mock.Mock(spec=DeclarativeStream)
-    # `spec=DeclarativeStream` is needed for `isinstance` work but `spec` does not expose dataclasses fields, so we create one ourselves
-    declarative_stream.retriever = mock.Mock()
-    manifest_declarative_source.streams.return_value = [declarative_stream]
-
-    error_message = list_streams(manifest_declarative_source, {})
-
-    assert error_message.type == MessageType.TRACE
-    assert "Error listing streams." == error_message.trace.error.message
-    assert "A declarative stream should only have a retriever of type HttpStream" in error_message.trace.error.internal_message
-
-
-def test_given_unexpected_error_when_list_streams_then_return_exception_message(manifest_declarative_source):
-    manifest_declarative_source.streams.side_effect = Exception("unexpected error")
+@pytest.mark.parametrize(
+    "streams_return_value, streams_side_effect, expected_internal_message, exact_match",
+    [
+        pytest.param(
+            [mock.Mock(spec=Stream)],
+            None,
+            "A declarative source should only contain streams of type DeclarativeStream",
+            False,
+            id="test_given_stream_is_not_declarative_stream_when_list_streams_then_return_exception_message",
+        ),
+        pytest.param(
+            # `spec=DeclarativeStream` is needed for `isinstance` work but `spec` does not expose dataclasses fields, so we create one ourselves
+            [create_mock_declarative_stream(mock.Mock())],
+            None,
+            "A declarative stream should only have a retriever of type HttpStream",
+            False,
+            id="test_given_declarative_stream_retriever_is_not_http_when_list_streams_then_return_exception_message",
+        ),
+        pytest.param(
+            None,
+            Exception("unexpected error"),
+            "unexpected error",
+            True,
+            id="test_given_unexpected_error_when_list_streams_then_return_exception_message",
+        ),
+    ],
+)
+def test_list_streams_error(manifest_declarative_source, streams_return_value, streams_side_effect, expected_internal_message, exact_match):
+    manifest_declarative_source.streams.return_value = streams_return_value
+    manifest_declarative_source.streams.side_effect = streams_side_effect
 
     error_message = list_streams(manifest_declarative_source, {})
 
-    assert error_message.type == MessageType.TRACE
+    assert error_message.type == Type.TRACE
     assert "Error listing streams." == error_message.trace.error.message
-    assert "unexpected error" == error_message.trace.error.internal_message
+    if exact_match:
+        assert expected_internal_message == error_message.trace.error.internal_message
+    else:
+        assert expected_internal_message in error_message.trace.error.internal_message
 
 
-def test_list_streams_integration_test():
-    config = copy.deepcopy(RESOLVE_MANIFEST_CONFIG)
+def test_list_streams_integration_test(manifest_source):
     command = "list_streams"
-    config["__command"] = command
-    source = ManifestDeclarativeSource(MANIFEST)
+    config = {**RESOLVE_MANIFEST_CONFIG, "__command": command}
     limits = TestReadLimits()
 
-    list_streams = handle_connector_builder_request(source, command, config, None, limits)
+    list_streams = handle_connector_builder_request(manifest_source, command, config, None, limits)
 
     assert list_streams.record.data == {
         "streams": [{"name": "stream_with_custom_requester", "url": "https://api.sendgrid.com/v3/marketing/lists"}]
     }
 
 
-def create_mock_http_stream(name, url_base, path):
-    http_stream = mock.Mock(spec=HttpStream, autospec=True)
-    http_stream.name = name
-    http_stream.url_base = url_base
-    http_stream.path.return_value = path
-    return http_stream
-
-
-def create_mock_declarative_stream(http_stream):
-    declarative_stream = mock.Mock(spec=DeclarativeStream, autospec=True)
-    declarative_stream.retriever = http_stream
-    return declarative_stream
-
-
 @pytest.mark.parametrize(
     "test_name, config, expected_max_records, expected_max_slices, expected_max_pages_per_slice",
     [
@@ -569,14 +582,6 @@ def test_create_source():
     assert source.streams(config={})[0].retriever.max_retries == 0
 
 
-def request_log_message(request: dict) -> AirbyteMessage:
-    return AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message=f"request:{json.dumps(request)}"))
-
-
-def response_log_message(response: dict) -> AirbyteMessage:
-    return AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message=f"response:{json.dumps(response)}"))
-
-
 def _create_request():
     url = "https://example.com/api"
     headers = {'Content-Type': 'application/json'}
@@ -586,7 +591,7 @@ def _create_request():
 def _create_response(body):
     response = requests.Response()
     response.status_code = 200
-    response._content = bytes(json.dumps(body), "utf-8")
+    response._content = json.dumps(body).encode()
     response.headers["Content-Type"] = "application/json"
     return response
 
@@ -595,7 +600,12 @@ def _create_page(response_body):
     return _create_request(), _create_response(response_body)
 
 
-@patch.object(HttpStream, "_fetch_next_page", side_effect=(_create_page({"result": [{"id": 0}, {"id": 1}],"_metadata": {"next": "next"}}), _create_page({"result": [{"id": 2}],"_metadata": {"next": "next"}})) * 10)
+# Pages are only read by the paginator and record selector, so the same request/response pairs can be returned on every fetch
+_FIRST_PAGE = _create_page({"result": [{"id": 0}, {"id": 1}], "_metadata": {"next": "next"}})
+_SECOND_PAGE = _create_page({"result": [{"id": 2}], "_metadata": {"next": "next"}})
+
+
+@patch.object(HttpStream, "_fetch_next_page", side_effect=(_FIRST_PAGE, _SECOND_PAGE) * 10)
 def test_read_source(mock_http_stream):
     """
     This test sort of acts as an integration test for the connector builder.
@@ -634,9 +644,10 @@ def test_read_source(mock_http_stream):
     streams = source.streams(config)
     for s in streams:
         assert isinstance(s.retriever, SimpleRetrieverTestReadDecorator)
+        assert s.get_json_schema() is s.get_json_schema()
 
 
-@patch.object(HttpStream, "_fetch_next_page", side_effect=(_create_page({"result": [{"id": 0}, {"id": 1}],"_metadata": {"next": "next"}}), _create_page({"result": [{"id": 2}],"_metadata": {"next": "next"}})))
+@patch.object(HttpStream, "_fetch_next_page", side_effect=(_FIRST_PAGE, _SECOND_PAGE))
 def test_read_source_single_page_single_slice(mock_http_stream):
     max_records = 100
     max_pages_per_slice = 1
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from functools import lru_cache
 from typing import Any, Mapping
 
 from airbyte_cdk.models.airbyte_protocol import ConfiguredAirbyteCatalog
@@ -23,5 +24,6 @@ def create_configured_catalog_dict(stream_name: str) -> Mapping[str, Any]:
     }
 
 
+@lru_cache(maxsize=None)
 def create_configured_catalog(stream_name: str) -> ConfiguredAirbyteCatalog:
     return ConfiguredAirbyteCatalog.parse_obj(create_configured_catalog_dict(stream_name))
@@ -5,6 +5,7 @@
 import json
 import logging
 import os
+import pkgutil
 import sys
 from typing import Any, List, Mapping
 from unittest.mock import call, patch
@@ -24,7 +25,10 @@ from airbyte_cdk.models import (
     Type,
 )
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.manifest_declarative_source import (
+    ManifestDeclarativeSource,
+    _get_declarative_component_schema_validator,
+)
 from airbyte_cdk.sources.streams.http import HttpStream
 from jsonschema.exceptions import ValidationError
 
@@ -744,6 +748,15 @@ class TestManifestDeclarativeSource:
         assert debug_logger.isEnabledFor(logging.DEBUG)
 
 
+def test_declarative_component_schema_is_only_loaded_once():
+    _get_declarative_component_schema_validator.cache_clear()
+    with patch(
+        "airbyte_cdk.sources.declarative.manifest_declarative_source.pkgutil.get_data", wraps=pkgutil.get_data
+    ) as get_data:
+        assert _get_declarative_component_schema_validator() is _get_declarative_component_schema_validator()
+    get_data.assert_called_once()
+
+
 def request_log_message(request: dict) -> AirbyteMessage:
     return AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message=f"request:{json.dumps(request)}"))
 